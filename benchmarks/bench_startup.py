@@ -0,0 +1,95 @@
+#!/usr/bin env python3
+"""
+Measure the startup cost of 'functools_too': the time to import it and the
+time to define a class with many decorated methods.
+
+Each measurement is taken in a fresh interpreter so that module caches from
+earlier runs do not hide the import cost.
+
+Usage:
+    python benchmarks/bench_startup.py [--methods N] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = '''
+from time import perf_counter
+start = perf_counter()
+import functools_too
+print(perf_counter() - start)
+'''
+
+CLASS_SCRIPT = '''
+from time import perf_counter
+import functools_too
+source = {source!r}
+start = perf_counter()
+exec(source, {{}})
+print(perf_counter() - start)
+'''
+
+
+def make_class_source(method_count):
+    lines = [
+        'from functools_too import *',
+        '',
+        'class Example:',
+    ]
+    decorators = [
+        '@cached_class_method',
+        '@cached_class_method(bind_args=True)',
+        '@cached_class_method(l1_size=4)',
+        '@cached_static_method(bind_args=True)',
+        '@cached_class_property',
+    ]
+    for i in range(method_count):
+        decorator = decorators[i % len(decorators)]
+        lines.append(f'    {decorator}')
+        if decorator.startswith('@cached_static_method'):
+            lines.append(f'    def method_{i}(a, b=None):')
+        elif decorator == '@cached_class_property':
+            lines.append(f'    def method_{i}(cls):')
+        else:
+            lines.append(f'    def method_{i}(cls, a, b=None):')
+        lines.append('        return None')
+    return '\n'.join(lines) + '\n'
+
+
+def run(script, repeat):
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True)
+        timings.append(float(result.stdout))
+    return timings
+
+
+def report(label, timings):
+    print(
+        f'{label}: median {statistics.median(timings) * 1000:.3f} ms,'
+        f' min {min(timings) * 1000:.3f} ms ({len(timings)} runs)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--methods', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=20)
+    options = parser.parse_args()
+
+    report('import functools_too', run(IMPORT_SCRIPT, options.repeat))
+    report(
+        f'define class with {options.methods} decorated methods',
+        run(
+            CLASS_SCRIPT.format(source=make_class_source(options.methods)),
+            options.repeat))
+
+
+if __name__ == '__main__':
+    main()
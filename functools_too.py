@@ -1,11 +1,12 @@
-from functools import cache, wraps
-from inspect import signature
-from weakref import ref, WeakKeyDictionary
+from collections import deque
+from functools import cache, update_wrapper, wraps
+from types import MethodType
+from weakref import ref, WeakKeyDictionary, WeakSet
 
 __all__ = [
     'bind_call_params', 'cached_static_method', 'cached_class_method',
     'cached_class_property', 'cached_static_property', 'class_property',
-    'per_target_decorated_method']
+    'per_target_decorated_method', 'tiered_cache']
 
 
 def class_property(func):
@@ -19,6 +20,29 @@ def class_property(func):
     return classmethod(property(func))
 
 
+def _call_params_binder(func):
+    """
+    Return a function that binds arguments to the signature of 'func' with
+    defaults applied and returns them as '(args, kwargs)'.
+
+    The signature is determined on the first call so that 'inspect' is
+    only imported when actually needed.
+    """
+    sig = None
+
+    def bind(*args, **kwargs):
+        nonlocal sig
+        if sig is None:
+            from inspect import signature
+            sig = signature(func)
+
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound.args, bound.kwargs
+
+    return bind
+
+
 def bind_call_params(func):
     """
     Transform a function to always receive its arguments in the same form
@@ -31,6 +55,9 @@ def bind_call_params(func):
     signature of the called function and not how they are given by the
     caller.
 
+    The signature is determined when the function is first called rather
+    than when it is decorated.
+
     Example:
         from datetime import datetime
         from functools import cache
@@ -41,13 +68,12 @@ def bind_call_params(func):
         def example(a, b='<b>', /, c='<c>', *, d='<d>'):
             return (datetime.now(), a, b, c, d)
     """
-    sig = signature(func)
+    bind = _call_params_binder(func)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        return func(*bound.args, **bound.kwargs)
+        args, kwargs = bind(*args, **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
@@ -111,6 +137,229 @@ def per_target_decorated_method(*, decorator):
     return inner_decorator
 
 
+class _L1State:
+    """
+    Per-thread state for '@tiered_cache': the thread's local cache, the
+    generation of the shared cache that it is consistent with, the queue
+    of its keys that other threads have since invalidated, and the keys
+    it has served that are yet to be marked as recently used in the
+    shared cache.
+    """
+    __slots__ = ('entries', 'generation', 'stale', 'touched', '__weakref__')
+
+    def __init__(self, generation):
+        self.entries = {}
+        self.generation = generation
+        self.stale = deque()
+        self.touched = {}
+
+
+# Marker queued to a thread's L1 state to drop all of its entries.
+_ALL_KEYS = object()
+
+# Marker separating positional from keyword args in a cache key.
+_KWD_MARK = object()
+
+
+def tiered_cache(*, l1_size=16, l2_maxsize=None, l1_consistency='key'):
+    """
+    Return a caching decorator with a small thread-local cache (L1) in
+    front of a cache that is shared by all threads (L2).
+
+    Hits in a thread's L1 are served without taking any lock, so this
+    reduces contention when many threads call the same cached function.
+    Misses fall through to L2, which is guarded by a lock.
+
+    'l1_size' is the maximum number of entries kept in each thread's L1
+    (oldest entries are dropped first). 'l2_maxsize' is the maximum
+    number of entries in L2 (least recently used entries are evicted
+    first, counting hits served from any thread's L1) or 'None' for no
+    limit.
+
+    When an entry is evicted from L2 or invalidated, the stale copies in
+    every thread's L1 are dropped before that thread's next lookup.
+    'l1_consistency' determines how: with 'key' (default), the key is
+    queued to each thread whose L1 holds it and only that entry is
+    dropped, while with 'all', a shared generation counter is bumped and
+    each thread drops its whole L1 when it sees the change. 'all' makes
+    each eviction cheap regardless of the number of threads, at the cost
+    of L1 hits, so it suits many threads with frequent evictions.
+
+    The decorated function gets 'cache_invalidate(*args, **kwargs)' to
+    remove the entry for a set of arguments and 'cache_clear()' to remove
+    all entries.
+
+    Example:
+        from functools_too import tiered_cache
+
+        @tiered_cache(l1_size=8, l2_maxsize=1024)
+        def example(a, b):
+            return a + b
+    """
+    if l1_size < 1:
+        raise ValueError(f'l1_size must be at least 1, not {l1_size!r}')
+    if l2_maxsize is not None and l2_maxsize < 1:
+        raise ValueError(
+            f'l2_maxsize must be at least 1 or None, not {l2_maxsize!r}')
+    if l1_consistency not in ('key', 'all'):
+        raise ValueError(
+            f"l1_consistency must be 'key' or 'all', not {l1_consistency!r}")
+
+    def decorator(func):
+        # Imported here so that 'threading' is only loaded when a tiered
+        # cache is actually created.
+        from threading import local, Lock
+
+        l2 = {}
+        lock = Lock()
+        # Generation of L2, bumped whenever it is cleared (or, with
+        # 'all' consistency, whenever any entry is removed).
+        generation = 0
+        # L1 states to queue invalidated keys to ('key' consistency) and
+        # to collect recently used keys from (when L2 has a maximum size).
+        l1_states = WeakSet()
+        track_states = l1_consistency == 'key' or l2_maxsize is not None
+        thread_local = local()
+
+        def make_key(args, kwargs):
+            if kwargs:
+                return args + (_KWD_MARK,) + tuple(kwargs.items())
+            return args
+
+        def l1_state():
+            try:
+                return thread_local.state
+            except AttributeError:
+                with lock:
+                    state = thread_local.state = _L1State(generation)
+                    if track_states:
+                        l1_states.add(state)
+                return state
+
+        def mark_stale(key):
+            # Must be called with the lock held.
+            nonlocal generation
+            if l1_consistency == 'all':
+                generation += 1
+                return
+
+            for state in l1_states:
+                # Entries are only added to an L1 with the lock held, so
+                # one without the key cannot get a stale copy of it.
+                if key in state.entries:
+                    stale = state.stale
+                    if len(stale) >= l1_size:
+                        # Bound the queue of a thread that is not calling
+                        # the function by having it drop its whole L1.
+                        stale.clear()
+                        stale.append(_ALL_KEYS)
+                    else:
+                        stale.append(key)
+
+        def sync_l1(state):
+            if state.generation != generation:
+                state.entries.clear()
+                state.stale.clear()
+                state.touched.clear()
+                state.generation = generation
+
+        def flush_touched(state):
+            # Must be called with the lock held. The state's own thread
+            # may be adding keys concurrently, so take them one at a time.
+            touched = state.touched
+            keys = []
+            while touched:
+                try:
+                    keys.append(touched.popitem()[0])
+                except KeyError:
+                    break
+
+            # 'popitem' returns the most recently added key first.
+            for key in reversed(keys):
+                if key in l2:
+                    # Re-insert to mark as most recently used.
+                    l2[key] = l2.pop(key)
+
+        def store_l1(state, key, value):
+            # Must be called with the lock held.
+            sync_l1(state)
+            entries = state.entries
+            entries[key] = value
+            if len(entries) > l1_size:
+                del entries[next(iter(entries))]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            state = l1_state()
+            sync_l1(state)
+            entries = state.entries
+            stale = state.stale
+
+            while stale:
+                stale_key = stale.popleft()
+                if stale_key is _ALL_KEYS:
+                    entries.clear()
+                else:
+                    entries.pop(stale_key, None)
+
+            try:
+                value = entries[key]
+            except KeyError:
+                pass
+            else:
+                if l2_maxsize is not None:
+                    # Recorded without the lock and applied to L2 before
+                    # its next eviction.
+                    state.touched[key] = None
+                return value
+
+            with lock:
+                try:
+                    value = l2.pop(key)
+                except KeyError:
+                    pass
+                else:
+                    # Re-insert to mark as most recently used.
+                    l2[key] = value
+                    store_l1(state, key, value)
+                    return value
+
+            value = func(*args, **kwargs)
+
+            with lock:
+                # Another thread may have stored a value meanwhile.
+                value = l2.setdefault(key, value)
+                if l2_maxsize is not None and len(l2) > l2_maxsize:
+                    for l1 in l1_states:
+                        flush_touched(l1)
+                    evicted_key = next(iter(l2))
+                    del l2[evicted_key]
+                    mark_stale(evicted_key)
+                store_l1(state, key, value)
+
+            return value
+
+        def cache_invalidate(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with lock:
+                if key in l2:
+                    del l2[key]
+                    mark_stale(key)
+
+        def cache_clear():
+            nonlocal generation
+            with lock:
+                l2.clear()
+                generation += 1
+
+        wrapper.cache_invalidate = cache_invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 def cached_static_method(func=None, /, *, bind_args=False):
     """
     Transform a method to a static-method cache, optionally based on
@@ -143,7 +392,65 @@ def cached_static_method(func=None, /, *, bind_args=False):
         return decorator
 
 
-def cached_class_method(func=None, /, *, bind_args=False):
+class _tiered_cached_class_method:
+    """
+    Class-method descriptor used by `@cached_class_method` for a tiered
+    cache.
+
+    Like a class method decorated with `@per_target_decorated_method`, but
+    the bound methods that it returns also have 'cache_invalidate' and
+    'cache_clear' for the cache of the class they are bound to.
+    """
+    def __init__(self, func, caching_decorator, bind_args):
+        update_wrapper(self, func)
+        self.func = func
+        self.caching_decorator = caching_decorator
+        self.bind_args = bind_args
+        self.decorated_by_target = WeakKeyDictionary()
+
+    def __get__(self, obj, objtype=None):
+        target = type(obj) if objtype is None else objtype
+        try:
+            decorated = self.decorated_by_target[target]
+        except KeyError:
+            # Decorated function is not in dictionary yet for current
+            # target. If another thread gets here first, use its function.
+            decorated = self.decorated_by_target.setdefault(
+                target, self.decorate_for(target))
+
+        return MethodType(decorated, target)
+
+    def decorate_for(self, target):
+        cached = self.caching_decorator(self.func)
+        # Cache keys include the target, so, as with 'cache' in
+        # `@per_target_decorated_method`, the target stays alive while its
+        # cache holds entries. This reference is weak only so that
+        # 'cache_invalidate' does not add another strong one.
+        target_ref = ref(target)
+
+        if self.bind_args:
+            decorated = bind_call_params(cached)
+            bind = _call_params_binder(cached)
+
+            def cache_invalidate(*args, **kwargs):
+                args, kwargs = bind(target_ref(), *args, **kwargs)
+                cached.cache_invalidate(*args, **kwargs)
+
+        else:
+            decorated = cached
+            invalidate_with_target = cached.cache_invalidate
+
+            def cache_invalidate(*args, **kwargs):
+                invalidate_with_target(target_ref(), *args, **kwargs)
+
+        decorated.cache_invalidate = cache_invalidate
+        decorated.cache_clear = cached.cache_clear
+        return decorated
+
+
+def cached_class_method(
+        func=None, /, *, bind_args=False, l1_size=None, l2_maxsize=None,
+        l1_consistency=None):
     """
     Transform a method to a class-method cache, optionally based on
     parameters in bound-argument form (see `@bind_call_params`),
@@ -157,13 +464,46 @@ def cached_class_method(func=None, /, *, bind_args=False):
     into a class method that caches results for the combination of target
     class and passed parameters, either in their given form (default or
     'bind_args=False') or in their bound form ('bind_args=True').
+
+    When called as a function with 'l1_size', each target's cache is a
+    `@tiered_cache` with a thread-local cache of that size in front of the
+    shared cache, and 'l2_maxsize' and 'l1_consistency' are passed through
+    to it ('l1_size' is required for either of them). The method then also
+    has 'cache_invalidate(*args, **kwargs)' and 'cache_clear()' for the
+    cache of the class it is accessed through (e.g.
+    'Example.example.cache_invalidate(1)'), with arguments in the same
+    form as for calls. These options are not available when used as a
+    decorator.
     """
     if func:
+        if (l1_size is not None or l2_maxsize is not None
+                or l1_consistency is not None):
+            raise ValueError(
+                'l1_size, l2_maxsize and l1_consistency are not available'
+                ' when used as a decorator')
+
         # Called as decorator w/o binding of args.
         return classmethod(
             per_target_decorated_method(decorator=cache)(func))
 
+    elif l1_size is not None:
+        tiered_options = {'l1_size': l1_size, 'l2_maxsize': l2_maxsize}
+        if l1_consistency is not None:
+            tiered_options['l1_consistency'] = l1_consistency
+        caching_decorator = tiered_cache(**tiered_options)
+
+        # return decorator with tiered cache.
+        def decorator(func):
+            return _tiered_cached_class_method(
+                func, caching_decorator, bind_args)
+
+        return decorator
+
     else:
+        if l2_maxsize is not None or l1_consistency is not None:
+            raise ValueError(
+                'l2_maxsize and l1_consistency require l1_size to be given')
+
         if bind_args:
             # return decorator with binding of args.
             def decorator(func):
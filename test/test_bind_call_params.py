@@ -1,6 +1,10 @@
 #!/usr/bin env python3
 
 from functools import wraps
+from inspect import signature
+import os
+import subprocess
+import sys
 import unittest
 
 from functools_too import *
@@ -54,3 +58,29 @@ class TestBindCallParams(unittest.TestCase):
         self.assertEqual({
             'args': ('<a>', '<b2>', '<c2>'), 'kwargs': {'d': '<d2>'}},
             self.captured_params)
+
+    def test_determines_signature_on_first_call(self):
+        def example(*args, **kwargs):
+            return {'args': args, 'kwargs': kwargs}
+
+        example_with_bound_params = bind_call_params(example)
+
+        def capture_the_params_signature(a, b='<b>', /, *, c='<c>'):
+            pass
+
+        example.__signature__ = signature(capture_the_params_signature)
+
+        self.assertEqual(
+            {'args': ('<a>', '<b>'), 'kwargs': {'c': '<c>'}},
+            example_with_bound_params('<a>'))
+
+
+class TestImport(unittest.TestCase):
+
+    def test_does_not_import_inspect(self):
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys, functools_too; print("inspect" in sys.modules)'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True)
+        self.assertEqual('False', result.stdout.strip())
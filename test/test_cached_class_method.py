@@ -2,6 +2,7 @@
 
 from functools import wraps
 from inspect import signature
+from threading import Thread
 import unittest
 
 from functools_too import *
@@ -52,6 +53,50 @@ class MethodWithArgsBindingCases(CommonCases):
         self.assertEqual((1, 1, 1), self.Example.example_method(1, b=1))
 
 
+class TieredCacheCases:
+
+    def call_in_other_thread(self, func, *args, **kwargs):
+        thread = Thread(target=func, args=args, kwargs=kwargs)
+        thread.start()
+        thread.join()
+
+    def test_applies_correct_descriptor_properties(self):
+        descriptor = self.Example.__dict__['example_method']
+        self.assertEqual('example_method', descriptor.__name__)
+        self.assertEqual('Hello from example_method!', descriptor.__doc__)
+        self.assertEqual(
+            ['cls', 'a', 'b'],
+            [param_key for param_key in signature(
+                descriptor.__wrapped__).parameters])
+
+    def test_invalidates_for_same_args(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((2, 1, 2), self.Example.example_method(1, 2))
+        self.Example.example_method.cache_invalidate(1, 1)
+        self.assertEqual((3, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((2, 1, 2), self.Example.example_method(1, 2))
+
+    def test_invalidates_l1_copies_in_other_threads(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.call_in_other_thread(
+            self.Example.example_method.cache_invalidate, 1, 1)
+        self.assertEqual((2, 1, 1), self.Example.example_method(1, 1))
+
+    def test_invalidates_only_for_class_accessed_through(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((2, 1, 1), self.ExampleSub.example_method(1, 1))
+        self.ExampleSub.example_method.cache_invalidate(1, 1)
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((3, 1, 1), self.ExampleSub.example_method(1, 1))
+
+    def test_clears_only_for_class_accessed_through(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((2, 1, 1), self.ExampleSub.example_method(1, 1))
+        self.Example.example_method.cache_clear()
+        self.assertEqual((3, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual((2, 1, 1), self.ExampleSub.example_method(1, 1))
+
+
 class TestCachedClassMethodAsDecorator(
         MethodWithoutArgsBindingCases, unittest.TestCase):
 
@@ -116,3 +161,76 @@ class TestCachedClassMethodAsFunctionWithArgsBinding(
 
         self.Example = Example
         self.ExampleSub = ExampleSub
+
+
+class TestCachedClassMethodAsFunctionWithTieredCache(
+        TieredCacheCases, MethodWithoutArgsBindingCases, unittest.TestCase):
+
+    def setUp(self):
+        self.call_count = 0
+
+        class Example:
+            @cached_class_method(l1_size=4)
+            def example_method(cls, a, b):
+                """Hello from example_method!"""
+                Example.test_instance.call_count += 1
+                return (Example.test_instance.call_count, a, b)
+
+        Example.test_instance = self
+
+        class ExampleSub(Example):
+            pass
+
+        self.Example = Example
+        self.ExampleSub = ExampleSub
+
+
+class TestCachedClassMethodAsFunctionWithTieredCacheAndArgsBinding(
+        TieredCacheCases, MethodWithArgsBindingCases, unittest.TestCase):
+
+    def setUp(self):
+        self.call_count = 0
+
+        class Example:
+            @cached_class_method(bind_args=True, l1_size=4)
+            def example_method(cls, a, b):
+                """Hello from example_method!"""
+                Example.test_instance.call_count += 1
+                return (Example.test_instance.call_count, a, b)
+
+        Example.test_instance = self
+
+        class ExampleSub(Example):
+            pass
+
+        self.Example = Example
+        self.ExampleSub = ExampleSub
+
+    def test_invalidates_for_same_args_in_different_form(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.Example.example_method.cache_invalidate(1, b=1)
+        self.assertEqual((2, 1, 1), self.Example.example_method(1, 1))
+
+
+class TestCachedClassMethodTieredCacheOptions(unittest.TestCase):
+
+    def test_rejects_tiered_cache_options_without_l1_size(self):
+        with self.assertRaises(ValueError):
+            cached_class_method(l2_maxsize=8)
+        with self.assertRaises(ValueError):
+            cached_class_method(l1_consistency='all')
+
+    def test_rejects_tiered_cache_options_with_func(self):
+        def example_method(cls, a, b):
+            pass
+
+        with self.assertRaises(ValueError):
+            cached_class_method(example_method, l1_size=4)
+        with self.assertRaises(ValueError):
+            cached_class_method(example_method, l2_maxsize=8)
+        with self.assertRaises(ValueError):
+            cached_class_method(example_method, l1_consistency='all')
+
+    def test_rejects_invalid_tiered_cache_options(self):
+        with self.assertRaises(ValueError):
+            cached_class_method(l1_size=4, l1_consistency='bogus')
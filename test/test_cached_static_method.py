@@ -1,6 +1,7 @@
 #!/usr/bin env python3
 
 from functools import wraps
+from inspect import signature
 import unittest
 
 from functools_too import *
@@ -86,6 +87,7 @@ class TestCachedStaticMethodAsFunctionWithArgsBinding(
         class Example:
             @cached_static_method(bind_args=True)
             def example_method(a, b):
+                """Hello from example_method!"""
                 Example.test_instance.call_count += 1
                 return (Example.test_instance.call_count, a, b)
 
@@ -96,3 +98,17 @@ class TestCachedStaticMethodAsFunctionWithArgsBinding(
 
         self.Example = Example
         self.ExampleSub = ExampleSub
+
+    def test_applies_correct_method_properties(self):
+        method = self.Example.example_method
+
+        self.assertEqual('example_method', method.__name__)
+        self.assertEqual('Hello from example_method!', method.__doc__)
+        self.assertEqual(
+            ['a', 'b'],
+            [param_key for param_key in signature(method).parameters])
+
+    def test_keeps_cache_reachable_through_wrapped(self):
+        self.assertEqual((1, 1, 1), self.Example.example_method(1, 1))
+        self.assertEqual(
+            1, self.Example.example_method.__wrapped__.cache_info().currsize)
@@ -0,0 +1,211 @@
+#!/usr/bin env python3
+
+import gc
+import os
+from queue import Queue
+import subprocess
+import sys
+from threading import Thread
+import unittest
+import weakref
+
+from functools_too import *
+
+
+class TestTieredCache(unittest.TestCase):
+
+    def setUp(self):
+        self.call_count = 0
+
+    def make_example(self, **options):
+
+        @tiered_cache(**options)
+        def example(a, b=None):
+            """Hello from example!"""
+            self.call_count += 1
+            return (self.call_count, a, b)
+
+        return example
+
+    def call_in_other_thread(self, func, *args, **kwargs):
+        results = []
+        thread = Thread(target=lambda: results.append(func(*args, **kwargs)))
+        thread.start()
+        thread.join()
+        return results[0]
+
+    def start_idle_thread(self):
+        """
+        Start a thread that makes the calls put to its queue and then
+        waits, idle, for more. Put 'None' to stop it.
+        """
+        calls = Queue()
+        results = Queue()
+
+        def run():
+            for call in iter(calls.get, None):
+                func, args = call
+                results.put(func(*args))
+
+        thread = Thread(target=run)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(calls.put, None)
+
+        def call_in_idle_thread(func, *args):
+            calls.put((func, args))
+            return results.get()
+
+        return call_in_idle_thread
+
+    def test_applies_correct_function_properties(self):
+        example = self.make_example()
+        self.assertEqual('example', example.__name__)
+        self.assertEqual('Hello from example!', example.__doc__)
+
+    def test_caches_for_same_args(self):
+        example = self.make_example()
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((1, 1, None), example(1))
+
+    def test_does_not_cache_for_different_args(self):
+        example = self.make_example()
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((2, 2, None), example(2))
+
+    def test_does_not_cache_for_same_args_in_different_form(self):
+        example = self.make_example()
+        self.assertEqual((1, 1, 2), example(1, 2))
+        self.assertEqual((2, 1, 2), example(1, b=2))
+
+    def test_shares_cached_values_between_threads(self):
+        example = self.make_example()
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((1, 1, None), self.call_in_other_thread(example, 1))
+
+    def test_serves_from_l2_after_eviction_from_l1(self):
+        example = self.make_example(l1_size=1)
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((2, 2, None), example(2))
+        self.assertEqual((1, 1, None), example(1))
+
+    def test_evicts_least_recently_used_from_l2(self):
+        example = self.make_example(l1_size=1, l2_maxsize=2)
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((2, 2, None), example(2))
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((3, 3, None), example(3))
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((4, 2, None), example(2))
+
+    def test_counts_l1_hits_as_recent_use_in_l2(self):
+        example = self.make_example(l1_size=4, l2_maxsize=2)
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((2, 2, None), example(2))
+        for _ in range(100):
+            self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((3, 3, None), example(3))
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((4, 2, None), example(2))
+
+    def test_counts_l1_hits_in_other_threads_as_recent_use_in_l2(self):
+        example = self.make_example(l1_size=4, l2_maxsize=2)
+        call_in_idle_thread = self.start_idle_thread()
+        self.assertEqual((1, 1, None), call_in_idle_thread(example, 1))
+        self.assertEqual((2, 2, None), example(2))
+        for _ in range(100):
+            self.assertEqual((1, 1, None), call_in_idle_thread(example, 1))
+        self.assertEqual((3, 3, None), example(3))
+        self.assertEqual((1, 1, None), example(1))
+
+    def test_drops_l1_copies_of_entries_evicted_from_l2(self):
+        example = self.make_example(l2_maxsize=1)
+        self.assertEqual((1, 1, None), example(1))
+        self.assertEqual((2, 2, None), self.call_in_other_thread(example, 2))
+        self.assertEqual((3, 1, None), example(1))
+
+    def test_drops_l1_copies_of_invalidated_entries_in_all_threads(self):
+        for l1_consistency in ('key', 'all'):
+            with self.subTest(l1_consistency=l1_consistency):
+                self.call_count = 0
+                example = self.make_example(l1_consistency=l1_consistency)
+                self.assertEqual((1, 1, None), example(1))
+                self.assertEqual((2, 2, None), example(2))
+                self.call_in_other_thread(example.cache_invalidate, 1)
+                self.assertEqual((3, 1, None), example(1))
+                self.assertEqual((2, 2, None), example(2))
+
+    def test_drops_l1_copies_of_all_entries_when_cleared(self):
+        for l1_consistency in ('key', 'all'):
+            with self.subTest(l1_consistency=l1_consistency):
+                self.call_count = 0
+                example = self.make_example(l1_consistency=l1_consistency)
+                self.assertEqual((1, 1, None), example(1))
+                self.call_in_other_thread(example.cache_clear)
+                self.assertEqual((2, 1, None), example(1))
+
+    def test_does_not_retain_evicted_args_for_idle_threads(self):
+        class Arg:
+            pass
+
+        for l1_consistency in ('key', 'all'):
+            with self.subTest(l1_consistency=l1_consistency):
+                example = self.make_example(
+                    l1_size=4, l2_maxsize=8, l1_consistency=l1_consistency)
+                call_in_idle_thread = self.start_idle_thread()
+                call_in_idle_thread(example, Arg())
+
+                arg_refs = []
+                for _ in range(1000):
+                    arg = Arg()
+                    arg_refs.append(weakref.ref(arg))
+                    example(arg)
+                del arg
+                gc.collect()
+
+                # Only those still in L2 or the main thread's L1 remain.
+                self.assertLessEqual(
+                    sum(1 for arg_ref in arg_refs if arg_ref()), 8 + 4)
+
+    def test_drops_l1_copies_for_idle_threads_after_repeated_eviction(self):
+        for l1_consistency in ('key', 'all'):
+            with self.subTest(l1_consistency=l1_consistency):
+                example = self.make_example(
+                    l1_size=4, l2_maxsize=4, l1_consistency=l1_consistency)
+                call_in_idle_thread = self.start_idle_thread()
+                for a in range(4):
+                    call_in_idle_thread(example, a)
+
+                # Evict and recompute the idle thread's keys repeatedly so
+                # more invalidations are queued than its L1 can hold.
+                for _ in range(10):
+                    for a in range(4, 8):
+                        example(a)
+                    for a in range(4):
+                        example(a)
+
+                self.call_count = 0
+                for a in range(4, 8):
+                    example(a)
+                for a in range(4):
+                    self.assertEqual(
+                        (4 + a + 1, a, None), call_in_idle_thread(example, a))
+
+    def test_does_not_import_threading_until_decorating(self):
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys, functools_too;'
+             ' print("threading" in sys.modules);'
+             ' functools_too.tiered_cache()(len);'
+             ' print("threading" in sys.modules)'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True)
+        self.assertEqual(['False', 'True'], result.stdout.split())
+
+    def test_rejects_invalid_options(self):
+        with self.assertRaises(ValueError):
+            tiered_cache(l1_size=0)
+        with self.assertRaises(ValueError):
+            tiered_cache(l2_maxsize=0)
+        with self.assertRaises(ValueError):
+            tiered_cache(l1_consistency='eventual')